@@ -1,122 +1,258 @@
 # app.py — Streamlit Math Quiz (복습 + 정답확인 강화 + 키워드 숫자버전)
-import time, hashlib, re, os
+import hashlib, hmac, re, os, functools, io
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter, Retry
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import streamlit as st
 
 st.set_page_config(page_title="수학 퀴즈", page_icon="🧮", layout="centered")
 
 # ===== 기본 경로 =====
 DATA_DIR = Path("data")
-DATA_DIR.mkdir(exist_ok=True)
+
+@st.cache_resource
+def _bootstrap_storage()->None:
+    # 스크립트는 상호작용마다 재실행되므로 디렉터리 준비는 프로세스당 한 번만
+    DATA_DIR.mkdir(exist_ok=True)
+
+_bootstrap_storage()
 
 # ===== 시트 설정 =====
 SHEET_CSV_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQv-m184X3IvYWV0Ntur0gEQhs2DO9ryWJGYiLV30TFV_jB0iSatddQoPAfNFAUybXjoyEHEg4ld5ZY/pub?output=csv"
 ADMIN_PASSWORD = "081224"
+_ADMIN_PASSWORD_BYTES = ADMIN_PASSWORD.encode("utf-8")
 LEVELS = ["전체", "하", "중", "상", "최상"]
 LEVEL_SCORE = {"하":1,"중":3,"상":5,"최상":7}
 KEYWORDS = ["전체", "공통수학1", "공통수학2", "수1", "수2"]  # ✅ 숫자 버전 키워드
 
 # ===== 시트 로드 =====
-@st.cache_data(show_spinner=False)
-def load_sheet(_cache_buster:int=0)->pd.DataFrame:
-    df=pd.read_csv(SHEET_CSV_URL,keep_default_na=False)
-    df.columns=[c.strip().lower() for c in df.columns]
+@st.cache_resource
+def _sheet_http()->dict:
+    # 재시도(지수 백오프) 세션 + 마지막 응답의 ETag/Last-Modified와 원본 표
+    retry=Retry(total=3,backoff_factor=0.5,status_forcelist=(429,500,502,503,504))
+    sess=requests.Session()
+    sess.mount("https://",HTTPAdapter(max_retries=retry)); sess.mount("http://",HTTPAdapter(max_retries=retry))
+    return {"session":sess,"etag":None,"last_modified":None,"raw":None}
+
+def _fetch_sheet_csv()->pd.DataFrame:
+    # 조건부 GET: 시트가 그대로면(304) 다운로드·CSV 파싱 없이 직전 원본 재사용
+    http=_sheet_http()
+    headers={}
+    if http["raw"] is not None:
+        if http["etag"]: headers["If-None-Match"]=http["etag"]
+        if http["last_modified"]: headers["If-Modified-Since"]=http["last_modified"]
+    with http["session"].get(SHEET_CSV_URL, headers=headers, timeout=10) as r:
+        if r.status_code==304: return http["raw"].copy()
+        r.raise_for_status()
+        body=r.content
+        validators={"etag":r.headers.get("ETag"),"last_modified":r.headers.get("Last-Modified")}
+    # Arrow 멀티스레드 파서로 읽기. 헤더만 먼저 읽어 모든 열을 문자열로 지정 (id 등 타입 추론/NaN 변환 생략)
+    # 문제 본문은 따옴표 안 줄바꿈이 흔하므로 newlines_in_values 필수 (헤더도 같은 파서로 읽음)
+    parse_opts=pacsv.ParseOptions(newlines_in_values=True)
+    names=pacsv.open_csv(io.BytesIO(body),parse_options=parse_opts).schema.names
+    table=pacsv.read_csv(io.BytesIO(body),parse_options=parse_opts,convert_options=pacsv.ConvertOptions(
+        column_types={n:pa.string() for n in names},strings_can_be_null=False))
+    table=table.rename_columns([c.strip().lower() for c in table.column_names])
+    for i,c in enumerate(table.column_names):
+        if c in ("level","topic","question","answer","image"):
+            table=table.set_column(i,c,pc.utf8_trim_whitespace(table[c]))
+    raw=table.to_pandas(types_mapper={pa.string():pd.StringDtype("pyarrow")}.get)
+    http.update(raw=raw,**validators)
+    return raw.copy()
+
+# 정리까지 끝난 DataFrame을 디스크에 보관 → 새 프로세스도 다운로드 없이 시작
+# (persist="disk"에서는 ttl이 무시되므로 갱신은 관리자 "시트 새로고침"으로)
+@st.cache_data(persist="disk", show_spinner=False)
+def load_sheet()->pd.DataFrame:
+    df=_fetch_sheet_csv()  # 열 이름 소문자화 + 주요 열 공백 제거까지 끝난 상태
     for c in ["level","topic","question","answer","image"]:
         if c not in df.columns: df[c]=""
-        df[c]=df[c].astype(str).str.strip()
     if "id" not in df.columns or (df["id"].astype(str).str.strip()=="").any():
-        df["id"]=df.apply(lambda r:hashlib.md5(
-            f"{r['level']}|{r['topic']}|{r['question']}|{r['answer']}".encode("utf-8")
-        ).hexdigest()[:12],axis=1)
+        keys=df["level"]+"|"+df["topic"]+"|"+df["question"]+"|"+df["answer"]
+        df["id"]=[hashlib.md5(k.encode("utf-8")).hexdigest()[:12] for k in keys]
+    # 이미지 경로도 디스크 캐시에 함께 저장됨 → 이미지 파일을 추가/변경하면 관리자 "시트 새로고침" 필요
+    img_index=_quiz_image_index()
+    df["_images"]=df["image"].map(lambda raw: get_image_paths(raw,img_index))  # 이미지 경로 해석은 로드 시 한 번만
+    df["_answer_norm"]=df["answer"].map(normalize_ans)  # 채점용 정답도 미리 정규화
+    df["level"]=df["level"].astype("category")  # 난이도 비교를 정수 코드 비교로
+    # 검색용 소문자 haystack + 필터 캐시 키(시트 내용이 바뀌면 함께 바뀜)
+    df["_hay"]=(df["topic"]+" "+df["question"]+" "+df["answer"]).str.lower()
+    # 문자열 열은 Arrow 버퍼로 (메모리 절약 + str.contains가 Arrow 커널로 처리)
+    df=df.astype({c:"string[pyarrow]" for c in ["id","topic","question","answer","image","_hay","_answer_norm"]})
+    df.attrs["version"]=int(pd.util.hash_pandas_object(df[["id","level","_hay"]]).sum())
     return df
 
+_NORMALIZE_TBL=str.maketrans("",""," $")  # 공백·$ 한 번에 제거
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_str(s:str)->str:
+    return s.translate(_NORMALIZE_TBL).replace("**","").lower().strip()
+
 def normalize_ans(s:str)->str:
     if s is None: return ""
-    return str(s).replace(" ","").replace("$","").replace("**","").lower().strip()
+    return _normalize_str(str(s))
 
-def filter_df(df,level,kw):
-    cond=pd.Series(True,index=df.index)
-    if level in ("하","중","상","최상"): cond&=(df["level"]==level)
-    if kw and kw!="전체":
-        hay=(df["topic"]+" "+df["question"]+" "+df["answer"]).str.lower()
-        cond&=hay.str.contains(kw.lower(),na=False)
-    return df[cond].copy()
+@st.cache_data(show_spinner=False)
+def _filter_masks(_df,df_version)->dict[str,dict[str,np.ndarray]]:
+    # 난이도/단원은 고정 목록 → 시트 로드 당 한 번만 값별 Boolean 마스크를 만든다
+    return {
+        "level":{lv:(_df["level"]==lv).to_numpy() for lv in LEVEL_SCORE},
+        "keyword":{kw:_df["_hay"].str.contains(kw.lower(),regex=False,na=False).to_numpy(dtype=bool)
+                   for kw in KEYWORDS if kw!="전체"},
+    }
 
-def calc_weighted_score(df_log):
-    if df_log.empty: return 0
-    return int(df_log[df_log["status"]=="correct"]["level"].map(LEVEL_SCORE).fillna(0).sum())
+@st.cache_data(show_spinner=False)
+def _filter_idx(_df,level,kw,df_version)->np.ndarray:
+    masks=_filter_masks(_df,df_version)
+    mask=masks["level"][level].copy() if level in masks["level"] else np.ones(len(_df),dtype=bool)
+    if kw and kw!="전체":
+        # 목록에 없는 키워드만 전체 문자열 스캔으로 대체
+        hit=masks["keyword"].get(kw)
+        if hit is None: hit=_df["_hay"].str.contains(kw.lower(),regex=False,na=False).to_numpy(dtype=bool)
+        np.logical_and(mask,hit,out=mask)
+    return _df.index.to_numpy()[mask]
+
+def filter_idx(df,level,kw)->np.ndarray:
+    # 재실행마다 다시 거르지 않도록 (난이도, 단원, 시트 버전)으로 캐시된 인덱스 배열 반환
+    # 같은 세션에서 조건이 그대로면 cache_data 조회(해시+역직렬화)까지 건너뜀
+    key=(level,kw,df.attrs.get("version"))
+    if st.session_state.get("_filter_cache_key")!=key:
+        st.session_state._filter_cache_result=_filter_idx(df,level,kw,key[2])
+        st.session_state._filter_cache_key=key
+    return st.session_state._filter_cache_result
+
+def start_queue(df,level,kw,seen_mask):
+    # "문제 풀기" 시점에 한 번만 거르고 섞어 두고, 이후엔 포인터만 전진
+    idx=filter_idx(df,level,kw)
+    st.session_state.quiz_queue=np.random.permutation(idx[~seen_mask[idx]])
+    st.session_state.queue_ptr=0
+
+def next_in_queue(seen_mask):
+    q=st.session_state.quiz_queue
+    while st.session_state.queue_ptr<len(q):
+        i=int(q[st.session_state.queue_ptr]); st.session_state.queue_ptr+=1
+        if not seen_mask[i]: return i
+    return None
+
+def tally_answer(stats,status,level):
+    # 로그는 누적만 되므로 결과 요약은 제출 시점에 바로 집계 (렌더링 때 재계산 없음)
+    stats[status]+=1
+    if status=="correct": stats["score"]+=LEVEL_SCORE.get(level,0)
 
 
 # ======================================================================
 # === 🔥 수정된 get_image_paths — PNG + JPG + JPEG 자동 인식 버전 ===
 # ======================================================================
-def get_image_paths(raw:str)->list[str]:
-    if not raw:
+QUIZ_IMG_DIR = DATA_DIR / "images" / "quiz"
+IMG_EXTS = [".png", ".jpg", ".jpeg"]  # 허용 확장자 (앞쪽이 우선)
+
+def _quiz_image_index()->dict[str,str]:
+    # 폴더 트리를 한 번만 훑어 "상대경로(확장자 제외, 소문자) → 파일 경로" 사전으로 (load_sheet 당 한 번)
+    if not QUIZ_IMG_DIR.is_dir():
+        return {}
+    files = [p for p in QUIZ_IMG_DIR.rglob("*") if p.suffix.lower() in IMG_EXTS]
+    files.sort(key=lambda p: IMG_EXTS.index(p.suffix.lower()))
+    index = {}
+    for p in files:
+        index.setdefault(p.relative_to(QUIZ_IMG_DIR).with_suffix("").as_posix().lower(), str(p))
+    return index
+
+def get_image_paths(raw:str, index:dict[str,str])->list[str]:
+    if not raw or not index:
         return []
-    base = DATA_DIR / "images" / "quiz"
-    exts = [".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG"]  # 허용 확장자
     parts = [p.strip() for p in re.split(r"[;,]+", raw) if p.strip()]
     found = []
 
     for p in parts:
-        p_path = Path(p)
-        stem = p_path.stem       # 파일명(확장자 제거)
-        parent = p_path.parent   # 혹시 폴더가 포함된 경우 대비
-
-        # 뒤에 붙은 확장자는 무시하고 동일 이름의 png/jpg/jpeg 탐색
-        for ext in exts:
-            cand = parent / f"{stem}{ext}"
-            local = base / cand
-            if local.exists():
-                found.append(str(local))
-                break
+        # 뒤에 붙은 확장자는 무시하고 동일 이름의 png/jpg/jpeg 탐색 (폴더 포함 가능)
+        local = index.get(os.path.splitext(Path(p).as_posix())[0].lower())
+        if local:
+            found.append(local)
 
     return found
 # ======================================================================
 # ======================================================================
 
 
+def _set_sheet(df):
+    # 시트가 바뀔 때만 행 dict 목록 / id→위치 사전 / 위치 기준 상태를 다시 만든다
+    s=st.session_state
+    s.df = df
+    s.df_records = df.to_dict("records")
+    s.id2idx = {r["id"]:i for i,r in enumerate(s.df_records)}
+    s.quiz_queue = np.array([],dtype=np.int64)
+    # 행 위치가 바뀔 수 있으므로 푼 문제 id 기준으로 마스크 재구성
+    s.seen_mask = df["id"].isin(s.get("seen_ids",set())).to_numpy(dtype=bool,copy=True)
+
 def _refresh_sheet_globally():
-    st.cache_data.clear()
-    st.session_state.df = load_sheet(_cache_buster=int(time.time()))
+    # 시트 캐시만 비움 (필터 캐시는 시트 버전으로 갈리고, 이미지 색인은 load_sheet가 매번 새로 만듦)
+    load_sheet.clear()
+    _set_sheet(load_sheet())
 
 # ===== 세션 초기 =====
 ss=st.session_state
-ss.setdefault("df",load_sheet())
 ss.setdefault("stage","home")
 ss.setdefault("filters",{"level":"전체","keyword":"전체"})
 ss.setdefault("seen_ids",set())
-ss.setdefault("logs",[])
+if "df" not in ss: _set_sheet(load_sheet())
+ss.setdefault("logs",{"qid":[],"status":[],"level":[]})  # 열 단위 리스트(SoA)
+ss.setdefault("stats",{"correct":0,"wrong":0,"blank":0,"score":0})
 ss.setdefault("result_saved",False)
 ss.setdefault("review_mode", False)
 ss.setdefault("review_selected", None)
 ss.setdefault("pending_feedback", None)
+ss.setdefault("queue_ptr", 0)
 
 # ===== 메인 =====
 st.title("길거리 수학 챌린지")
 
-with st.sidebar:
-    st.markdown("메뉴")
-
-    if "admin_unlocked" not in ss:
-        ss.admin_unlocked = False
+# 관리자 UI는 fragment로: 로그인/새로고침 클릭은 해당 부분만 재실행 (화면 전환만 전체 재실행)
+def _try_admin_login():
+    # on_click 콜백은 fragment 재실행 전에 처리되므로 상태만 바꾸면 되고 st.rerun()이 필요 없음
+    ss.admin_unlocked = hmac.compare_digest((ss.get("admin_pw") or "").encode("utf-8"), _ADMIN_PASSWORD_BYTES)
+    ss.admin_login_failed = not ss.admin_unlocked
 
+@st.fragment
+def _admin_login_box():
     with st.expander("관리자"):
         if not ss.admin_unlocked:
-            pw = st.text_input("관리자 비밀번호", type="password")
-            if st.button("관리자 로그인"):
-                if pw == ADMIN_PASSWORD:
-                    ss.admin_unlocked = True
-                    st.success("관리자 모드 활성화")
-                    st.rerun()
-                else:
-                    st.error("비밀번호가 올바르지 않습니다.")
+            st.text_input("관리자 비밀번호", type="password", key="admin_pw")
+            st.button("관리자 로그인", on_click=_try_admin_login)
+            if ss.pop("admin_login_failed", False):
+                st.error("비밀번호가 올바르지 않습니다.")
         else:
             st.success("관리자 모드")
             if st.button("관리자 패널로 이동"):
                 ss.stage = "admin"; st.rerun()
 
+@st.fragment
+def _admin_panel():
+    st.header("🛠️ 관리자 패널")
+    st.subheader("시트 전역 새로고침")
+    st.caption("배포 후 시트가 수정되었거나 문제 이미지 파일을 추가·변경했을 때 눌러주세요.")
+    if st.button("🔄 시트 새로고침", type="primary"):
+        try:
+            _refresh_sheet_globally()
+            st.success("시트를 새로 불러왔습니다.")
+        except Exception as e:
+            st.error(f"실패: {e}")
+
+    if st.button("🏠 홈으로 돌아가기"):
+        ss.stage="home"; st.rerun()
+
+with st.sidebar:
+    st.markdown("메뉴")
+
+    if "admin_unlocked" not in ss:
+        ss.admin_unlocked = False
+
+    _admin_login_box()
+
 # ===== 홈 =====
 if ss.stage=="home":
     df=ss.df
@@ -130,11 +266,11 @@ if ss.stage=="home":
         if st.button("문제 풀기",type="primary"):
             ss.filters={"level":level,"keyword":keyword}
             ss.review_mode = False
-            df_f=filter_df(df,level,keyword)
-            unseen=df_f[~df_f["id"].isin(ss.seen_ids)]
-            if unseen.empty: st.info("조건에 맞는 문제가 없습니다.")
+            start_queue(df,level,keyword,ss.seen_mask)
+            pick=next_in_queue(ss.seen_mask)
+            if pick is None: st.info("조건에 맞는 문제가 없습니다.")
             else:
-                ss.current_row_idx=int(unseen.sample(1).index[0])
+                ss.current_row_idx=pick
                 ss.stage="quiz"; st.rerun()
 
     with c2:
@@ -149,7 +285,7 @@ if ss.stage=="home":
 # ===== 복습 문제 선택 =====
 elif ss.stage == "review_select":
     st.subheader("📘 복습할 문제 선택")
-    df = ss.df[ss.df["id"].isin(ss.seen_ids)]
+    df = ss.df[ss.seen_mask]
     if df.empty:
         st.info("푼 문제가 없습니다.")
         if st.button("홈으로"): ss.stage="home"; st.rerun()
@@ -168,29 +304,37 @@ elif ss.stage == "review_select":
 # ===== 퀴즈 =====
 elif ss.stage=="quiz":
     if ss.review_mode and ss.review_selected:
-        row = ss.df[ss.df["id"] == ss.review_selected].iloc[0]
+        pos = ss.id2idx[ss.review_selected]
     else:
-        row = ss.df.loc[ss.current_row_idx]
+        pos = ss.current_row_idx
+    row = ss.df_records[pos]
 
     st.markdown(f"**[{row.get('topic','')}] {row.get('level','')} 난이도**")
     st.markdown("> 문제:\n"+row.get("question",""))
-    imgs=get_image_paths(row.get("image",""))
+    imgs=row["_images"]
     if imgs:
         for im in imgs: st.image(im,use_container_width=True)
 
     ans_key=f"ans_{row['id']}"
-    st.text_input("정답 입력",key=ans_key)
-    b1,b2,b3=st.columns(3)
+    # 입력 중에는 재실행하지 않고, 버튼(또는 Enter=첫 번째 버튼)으로 제출할 때만 한 번 재실행
+    with st.form("quiz_form"):
+        st.text_input("정답 입력",key=ans_key)
+        b1,b2,b3=st.columns(3)
+        nxt=b1.form_submit_button("제출 후 다음 문제")
+        end=b2.form_submit_button("제출 후 종료")
+        quit_=b3.form_submit_button("그만풀기")
 
     def commit(show_feedback=False,nextq=False):
         ua=normalize_ans(st.session_state.get(ans_key,""))
-        gt=normalize_ans(row.get("answer",""))
+        gt=row["_answer_norm"]
         correct = (ua and ua==gt)
 
         if not ss.review_mode:
             status="correct" if correct else ("blank" if ua=="" else "wrong")
-            ss.logs.append({"qid":row["id"],"status":status,"level":row["level"]})
+            ss.logs["qid"].append(row["id"]); ss.logs["status"].append(status); ss.logs["level"].append(row["level"])
+            tally_answer(ss.stats,status,row["level"])
             ss.seen_ids.add(row["id"])
+            ss.seen_mask[pos]=True
 
         if show_feedback:
             ss.pending_feedback = {
@@ -204,12 +348,9 @@ elif ss.stage=="quiz":
         else:
             ss.stage="result"; st.rerun()
 
-    with b1:
-        if st.button("제출 후 다음 문제"): commit(show_feedback=True,nextq=True)
-    with b2:
-        if st.button("제출 후 종료"): commit(show_feedback=True,nextq=False)
-    with b3:
-        if st.button("그만풀기"): ss.stage="home"; st.rerun()
+    if nxt: commit(show_feedback=True,nextq=True)
+    elif end: commit(show_feedback=True,nextq=False)
+    elif quit_: ss.stage="home"; st.rerun()
 
 # ===== 정답 확인 =====
 elif ss.stage=="feedback":
@@ -217,14 +358,16 @@ elif ss.stage=="feedback":
     if not fb: ss.stage="home"; st.rerun()
 
     st.markdown("### 📊 정답 확인")
+    # 결과 배너 + 안내 문구를 HTML 한 번으로 전송 (st.html은 마크다운 파싱을 거치지 않음)
     if fb["correct"]:
-        st.markdown("<h1 style='color:limegreen; font-size:70px; text-align:center;'>✅ 정답!</h1>", unsafe_allow_html=True)
+        banner = "<h1 style='color:limegreen; font-size:70px; text-align:center;'>✅ 정답!</h1>"
     else:
-        st.markdown("<h1 style='color:red; font-size:70px; text-align:center;'>❌ 오답!</h1>", unsafe_allow_html=True)
+        banner = "<h1 style='color:red; font-size:70px; text-align:center;'>❌ 오답!</h1>"
         if fb["ua"] == "":
-            st.markdown("<h2 style='text-align:center;'>아무 답도 입력하지 않았어요.</h2>", unsafe_allow_html=True)
+            banner += "<h2 style='text-align:center;'>아무 답도 입력하지 않았어요.</h2>"
         else:
-            st.markdown(f"<h3 style='text-align:center;'>정답은 <b style='color:orange;'>{fb['gt']}</b> 입니다.</h3>", unsafe_allow_html=True)
+            banner += f"<h3 style='text-align:center;'>정답은 <b style='color:orange;'>{fb['gt']}</b> 입니다.</h3>"
+    st.html(banner)
 
     st.markdown("---")
     c1, c2, c3 = st.columns(3)
@@ -233,12 +376,11 @@ elif ss.stage=="feedback":
         if c2.button("🏠 홈으로 돌아가기"): ss.stage="home"; st.rerun()
     else:
         if c1.button("➡️ 다음 문제로 넘어가기"):
-            df_f=filter_df(ss.df,ss.filters.get("level","전체"),ss.filters.get("keyword","전체"))
-            unseen=df_f[~df_f["id"].isin(ss.seen_ids)]
-            if unseen.empty:
+            pick=next_in_queue(ss.seen_mask)
+            if pick is None:
                 ss.stage="result"
             else:
-                ss.current_row_idx=int(unseen.sample(1).index[0])
+                ss.current_row_idx=pick
                 ss.stage="quiz"
             ss.pending_feedback=None; st.rerun()
         if c2.button("📘 결과 요약 보기"):
@@ -249,13 +391,13 @@ elif ss.stage=="feedback":
 # ===== 결과 =====
 elif ss.stage=="result":
     st.subheader("결과 요약")
-    if not ss.logs: st.info("제출 없음.")
+    if not ss.logs["qid"]: st.info("제출 없음.")
     else:
-        df_log=pd.DataFrame(ss.logs)
-        total=len(df_log); correct=(df_log["status"]=="correct").sum()
-        blank=(df_log["status"]=="blank").sum(); wrong=total-correct-blank
+        stats=ss.stats
+        total=len(ss.logs["qid"]); correct=stats["correct"]
+        blank=stats["blank"]; wrong=stats["wrong"]
         rate=(correct/total*100) if total else 0
-        sc=calc_weighted_score(df_log)
+        sc=stats["score"]
         st.write(f"총 {total}문항 | 정답 {correct} | 오답 {wrong} | 미기입 {blank} | 정답률 {rate:.1f}% | 점수 {sc}")
         if st.button("홈으로 돌아가기",type="primary"):
             ss.stage="home"; st.rerun()
@@ -268,15 +410,4 @@ elif ss.stage=="admin":
             ss.stage = "home"; st.rerun()
         st.stop()
 
-    st.header("🛠️ 관리자 패널")
-    st.subheader("시트 전역 새로고침")
-    st.caption("배포 후 시트가 수정되었을 때 눌러주세요.")
-    if st.button("🔄 시트 새로고침", type="primary"):
-        try:
-            _refresh_sheet_globally()
-            st.success("시트를 새로 불러왔습니다.")
-        except Exception as e:
-            st.error(f"실패: {e}")
-
-    if st.button("🏠 홈으로 돌아가기"):
-        ss.stage="home"; st.rerun()
+    _admin_panel()